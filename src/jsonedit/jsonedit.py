@@ -5,6 +5,7 @@
 import json
 import sys
 import copy
+import itertools
 import subprocess
 import shutil
 import tkinter as tk
@@ -15,6 +16,11 @@ from pathlib import Path
 import os
 import tempfile
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ----------------------------
 # globals
@@ -30,17 +36,22 @@ g_state = {
     "status_validity": "(no document)",
     "status_error":    "",
     "find_term":       None,
-    "find_matches":    [],
+    "find_matches":    [],    # matches realized so far
+    "find_iter":       None,  # generator of further matches; None once exhausted
     "find_index":      -1,
 }
 
 g_widget_state = {
-    "path_to_iid":          {},
-    "iid_to_path":          {},
+    "root_iid":             None,
+    "children_of":          {},     # iid -> {key: child iid}
+    "iid_link":             {},     # iid -> (parent iid, key); the root's parent is ""
     "iid_to_kind":          {},
-    "expanded_paths":       set(),
+    "expanded_iids":        set(),  # kept current by <<TreeviewOpen>>/<<TreeviewClose>>
+    "tree_doc":             None,   # the doc the tree currently mirrors
+    "unpopulated":          set(),  # iids holding a placeholder instead of their children
     "suppress_tree_select": 0,
     "_iid_counter":         0,
+    "text_dirty":           False,  # mirrors text.edit_modified(); set by <<Modified>>, cleared by set_text
 }
 
 g_clipboard_state = {
@@ -51,6 +62,36 @@ g_clipboard_state = {
 
 g_script = ""
 
+g_path_cache = {}  # (id(doc), path) -> (doc, obj); cleared on every dispatch
+
+g_path_pool = {}  # path -> the one shared tuple equal to it
+
+PATH_POOL_LIMIT = 4096
+
+g_text_cache = {
+    "doc":        None,  # the doc the cached texts were rendered from
+    "texts":      {},    # path -> pretty-printed subtree
+    "copies":     {},    # (path, flags) -> text last put on the clipboard
+    "odd_floats": {},    # path -> has_odd_float() of the subtree there
+}
+
+TEXT_CACHE_LIMIT = 64
+
+g_config_cache = {
+    "doc": None,  # the doc the cached embedded config was extracted from
+    "cfg": None,
+}
+
+g_parse_cache = {
+    "text": None,  # the last text committed from the text pane
+    "obj":  None,  # what it parsed to
+}
+
+g_key_index = {
+    "doc":   None,  # the doc last searched with find
+    "index": None,  # build_key_index() of it, built on the doc's second new find term
+}
+
 widgets = {}
 
 THEME_DARK = {
@@ -76,6 +117,62 @@ THEME_DARK = {
     "tree_select_fg": "#ffffff",
 }
 
+# built once; apply_dark_mode and the dialogs only hand these to Tk
+_TEXT_THEME = {
+    "background":       THEME_DARK["text_bg"],
+    "foreground":       THEME_DARK["text_fg"],
+    "insertbackground": THEME_DARK["text_insert"],
+    "selectbackground": THEME_DARK["text_select_bg"],
+    "selectforeground": THEME_DARK["text_select_fg"],
+}
+
+_STYLE_CONFIG = {
+    "Treeview": {
+        "background":      THEME_DARK["tree_bg"],
+        "foreground":      THEME_DARK["tree_fg"],
+        "fieldbackground": THEME_DARK["tree_bg"],
+    },
+    "TLabel": {
+        "background": THEME_DARK["bg"],
+        "foreground": THEME_DARK["fg"],
+    },
+    "TFrame": {
+        "background": THEME_DARK["bg"],
+    },
+    "TPanedwindow": {
+        "background": THEME_DARK["bg"],
+    },
+    "TButton": {
+        "background":     THEME_DARK["button_bg"],
+        "foreground":     THEME_DARK["button_fg"],
+        "bordercolor":    THEME_DARK["bg"],
+        "focusthickness": 0,
+    },
+    "TScrollbar": {
+        "background":  THEME_DARK["bg"],
+        "troughcolor": THEME_DARK["bg"],
+        "bordercolor": THEME_DARK["bg"],
+        "lightcolor":  THEME_DARK["bg"],
+        "darkcolor":   THEME_DARK["bg"],
+        "arrowcolor":  THEME_DARK["fg"],
+    },
+}
+
+_STYLE_MAP = {
+    "Treeview": {
+        "background": [("selected", THEME_DARK["tree_select_bg"])],
+        "foreground": [("selected", THEME_DARK["tree_select_fg"])],
+    },
+    "TButton": {
+        "background": [("active", THEME_DARK["button_active_bg"])],
+        "foreground": [("disabled", THEME_DARK["muted"])],
+    },
+    "TScrollbar": {
+        "background": [("active", THEME_DARK["bg"])],
+        "arrowcolor": [("active", THEME_DARK["fg"])],
+    },
+}
+
 
 # ----------------------------
 # tiny helpers
@@ -88,11 +185,57 @@ def is_leaf_string_path(doc, p):
         return False
     return isinstance(obj, str)
 
+_PRETTY_ENC = json.JSONEncoder(indent=2, ensure_ascii=False, sort_keys=False)
+_COMPACT_ENC = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
 def pretty(obj, indent=2):
+    if indent == 2:
+        return _PRETTY_ENC.encode(obj)
     return json.dumps(obj, indent=indent, ensure_ascii=False, sort_keys=False)
 
 def compact(obj):
-    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    return _COMPACT_ENC.encode(obj)
+
+def has_odd_float(obj):
+    """True if obj holds a float that orjson writes differently from json.
+
+    That is NaN and the infinities, which orjson writes as null, and every
+    float json writes with an exponent (1e+16, 1e-05), which orjson writes
+    as 1e16 and 0.00001.
+    """
+    stack = [obj]
+    pop, extend = stack.pop, stack.extend
+    while stack:
+        o = pop()
+        t = type(o)
+        if t is float:
+            if o and not 1e-4 <= abs(o) < 1e16:  # NaN fails the range test too
+                return True
+        elif t is dict:
+            extend(o.values())
+        elif t is list:
+            extend(o)
+    return False
+
+def _orjson_text(obj, indent, odd_floats=has_odd_float):
+    """orjson.dumps(obj) as str, or None where orjson is missing or would differ from json."""
+    if orjson is None or odd_floats(obj):
+        return None
+    try:
+        b = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    except TypeError:  # e.g. ints wider than 64 bits
+        return None
+    return b.decode("utf-8")
+
+def pretty_fast(obj, odd_floats=has_odd_float):
+    """pretty(obj), through orjson's C encoder when it is installed."""
+    s = _orjson_text(obj, True, odd_floats)
+    return s if s is not None else pretty(obj)
+
+def compact_fast(obj, odd_floats=has_odd_float):
+    """compact(obj), through orjson's C encoder when it is installed."""
+    s = _orjson_text(obj, False, odd_floats)
+    return s if s is not None else compact(obj)
 
 def path_to_str(p):
     if p is None:
@@ -105,31 +248,27 @@ def get_at_path(doc, p):
         obj = obj[k]
     return obj
 
-def set_at_path(doc, p, value):
-    if p is None or len(p) == 0:
-        return value
-    obj = doc
-    for k in p[:-1]:
-        obj = obj[k]
-    obj[p[-1]] = value
-    return doc
-
-def delete_at_path(doc, p):
-    obj = doc
-    for k in p[:-1]:
-        obj = obj[k]
-    last = p[-1]
-    if isinstance(obj, dict):
-        del obj[last]
-    else:
-        del obj[last]
-    return doc
+def lookup_path(doc, p):
+    """get_at_path, memoized until the next dispatch; doc must not be mutated afterwards."""
+    key = (id(doc), p)
+    hit = g_path_cache.get(key)
+    if hit is not None and hit[0] is doc:
+        return hit[1]
+    obj = get_at_path(doc, p)
+    g_path_cache[key] = (doc, obj)
+    return obj
 
 def parent_path(p):
     if p is None or len(p) == 0:
         return None
     return p[:-1]
 
+def intern_path(p):
+    """Returns the pooled tuple equal to p, so repeats of a path are one object."""
+    if len(g_path_pool) >= PATH_POOL_LIMIT:
+        g_path_pool.clear()
+    return g_path_pool.setdefault(p, p)
+
 def last_key(p):
     if p is None or len(p) == 0:
         return None
@@ -138,6 +277,64 @@ def last_key(p):
 def deep_copy(x):
     return copy.deepcopy(x)
 
+def swap_dict_keys(d, i, j):
+    """Swaps the positions of the i-th and j-th keys (i < j) of d in place.
+
+    Only the keys from position i onward are re-inserted.
+    """
+    tail = list(itertools.islice(d.items(), i, None))
+    for k, _ in tail:
+        del d[k]
+    tail[0], tail[j - i] = tail[j - i], tail[0]
+    d.update(tail)
+
+def dict_insert_after(d, after_key, key, value):
+    """Returns a copy of d with key: value placed right after after_key."""
+    it = iter(d.items())
+    out = {}
+    for k, v in it:
+        out[k] = v
+        if k == after_key:
+            out[key] = value
+            break
+    out.update(it)
+    return out
+
+def dict_rename_key(d, old_key, new_key):
+    """Returns a copy of d with old_key renamed to new_key, in the same position."""
+    it = iter(d.items())
+    out = {}
+    for k, v in it:
+        if k == old_key:
+            out[new_key] = v
+            break
+        out[k] = v
+    out.update(it)
+    return out
+
+def shallow_copy(x):
+    return dict(x) if isinstance(x, dict) else list(x)
+
+def clone_along_path(doc, p):
+    """Copies only the containers along p; all other subtrees are shared with doc.
+
+    Returns (new_doc, obj) where obj is the fresh copy of the container at p.
+    """
+    new_doc = obj = shallow_copy(doc)
+    for k in p:
+        child = shallow_copy(obj[k])
+        obj[k] = child
+        obj = child
+    return new_doc, obj
+
+def replace_along_path(doc, p, value):
+    """Returns a copy of doc with value at p, copying only the containers above p."""
+    if not p:
+        return value
+    new_doc, parent = clone_along_path(doc, p[:-1])
+    parent[p[-1]] = value
+    return new_doc
+
 def atomic_write_text(path, text):
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -156,8 +353,13 @@ def atomic_write_text(path, text):
             pass
 
 def extract_embedded_editor_config(doc):
-    # Returns a dict or None
+    # Returns a dict or None; the answer for the most recent doc is remembered
+    if g_config_cache["doc"] is not doc:
+        g_config_cache["doc"] = doc
+        g_config_cache["cfg"] = _find_embedded_editor_config(doc)
+    return g_config_cache["cfg"]
 
+def _find_embedded_editor_config(doc):
     # Case 1: root is dict
     if isinstance(doc, dict):
         cfg = doc.get("jsonedit")
@@ -174,29 +376,140 @@ def extract_embedded_editor_config(doc):
 
     return None
 
-def collect_key_paths(node, current_path, target_key, out_paths):
-    if isinstance(node, dict):
-        for key, value in node.items():
-            if key == target_key:
-                out_paths.append(current_path + [key])
-            collect_key_paths(value, current_path + [key], target_key, out_paths)
+def iter_key_paths(root, target_key):
+    """Lazily yields the path tuple of every object key equal to target_key, in document order.
+
+    Walks with a single mutable path list of the containers entered so far;
+    a tuple is only built for a match.
+    """
+    _dict, _list = dict, list
+    t = type(root)
+    if t is not _dict and t is not _list:
+        return
+    path = []
+    stack = [(iter(root.items()) if t is _dict else enumerate(root), t is _dict)]
+    while stack:
+        it, in_dict = stack[-1]
+        # leaves are consumed in this loop; break out only to descend
+        for k, v in it:
+            if in_dict and k == target_key:
+                yield (*path, k)
+            t = type(v)
+            if t is _dict:
+                path.append(k)
+                stack.append((iter(v.items()), True))
+                break
+            if t is _list:
+                path.append(k)
+                stack.append((enumerate(v), False))
+                break
+        else:
+            stack.pop()
+            if path:
+                path.pop()
+
+def build_key_index(root):
+    """Indexes every object key in root, in one walk.
+
+    Containers are numbered as they are entered; "parent" and "key" give
+    each container's parent number and the key it sits under (container 0
+    is root). "containers" maps each object key to the numbers of the
+    dicts holding it, in document order. Paths are only rebuilt for the
+    keys asked for, by iter_indexed_paths.
+    """
+    parents, keys, containers = [-1], [None], {}
+    _dict, _list = dict, list
+    t = type(root)
+    if t is _dict or t is _list:
+        setdefault = containers.setdefault
+        add_parent, add_key = parents.append, keys.append
+        stack = [(iter(root.items()) if t is _dict else enumerate(root), t is _dict, 0)]
+        while stack:
+            it, in_dict, n = stack[-1]
+            for k, v in it:
+                if in_dict:
+                    setdefault(k, []).append(n)
+                t = type(v)
+                if t is _dict:
+                    stack.append((iter(v.items()), True, len(parents)))
+                    add_parent(n)
+                    add_key(k)
+                    break
+                if t is _list:
+                    stack.append((enumerate(v), False, len(parents)))
+                    add_parent(n)
+                    add_key(k)
+                    break
+            else:
+                stack.pop()
+    return {"parent": parents, "key": keys, "containers": containers}
 
-    elif isinstance(node, list):
-        for i, value in enumerate(node):
-            collect_key_paths(value, current_path + [i], target_key, out_paths)
+def iter_indexed_paths(index, target_key):
+    """Lazily yields the path tuple of every object key equal to target_key, from a build_key_index index."""
+    parents, keys = index["parent"], index["key"]
+    for n in index["containers"].get(target_key, ()):
+        path = [target_key]
+        while n:
+            path.append(keys[n])
+            n = parents[n]
+        path.reverse()
+        yield tuple(path)
 
 
 # ----------------------------
 # validation
 # ----------------------------
 
+# orjson reads integers wider than 64 bits as floats; only a run of 19+ digits can be one
+_DIGITS_TO_ZERO = bytes.maketrans(b"123456789", b"000000000")
+_WIDE_DIGITS = b"0" * 19
+_INT64_LIMIT = float(2**63)
+
+def _may_hold_wide_int(b):
+    """True if b has a run of 19+ digits that is not the fraction of a number."""
+    t = b.translate(_DIGITS_TO_ZERO)
+    i = t.find(_WIDE_DIGITS)
+    while i != -1:
+        if i == 0 or t[i - 1] not in b".0":
+            return True
+        i = t.find(_WIDE_DIGITS, i + len(_WIDE_DIGITS))
+    return False
+
+def _has_wide_float(obj):
+    """True if obj holds a float too large for a 64-bit int anywhere."""
+    stack = [obj]
+    pop, extend = stack.pop, stack.extend
+    while stack:
+        o = pop()
+        t = type(o)
+        if t is float:
+            if not -_INT64_LIMIT < o < _INT64_LIMIT:
+                return True
+        elif t is dict:
+            extend(o.values())
+        elif t is list:
+            extend(o)
+    return False
+
 def parse_json_text(s):
+    """Parses str or bytes; orjson is used when it is installed and agrees with json on s."""
+    if orjson is not None:
+        try:
+            obj = orjson.loads(s)
+        except orjson.JSONDecodeError:
+            pass  # json reports the error, and accepts NaN/Infinity and lone surrogates
+        else:
+            b = s if isinstance(s, bytes) else s.encode("utf-8")
+            if not _may_hold_wide_int(b) or not _has_wide_float(obj):
+                return obj, None
     try:
         obj = json.loads(s)
         return obj, None
     except json.JSONDecodeError as e:
         msg = f"{e.msg} (line {e.lineno}, col {e.colno})"
         return None, msg
+    except UnicodeDecodeError as e:
+        return None, f"{e.reason} (byte {e.start})"
 
 def parse_partial_dict_pair_text(s):
     wrapped = "{" + s + "}"
@@ -225,7 +538,7 @@ def selected_node_is_dict(state):
     if doc is None or path is None:
         return False
     try:
-        return isinstance(get_at_path(doc, path), dict)
+        return isinstance(lookup_path(doc, path), dict)
     except Exception:
         return False
 
@@ -268,37 +581,32 @@ def poll_clipboard_state():
 # ----------------------------
 
 def first_bifurcation_path(doc):
-    p = tuple()
+    p = []
     obj = doc
     while True:
-        if isinstance(obj, list) and len(obj) == 1:
-            p = p + (0,)
+        t = type(obj)
+        if t is list and len(obj) == 1:
+            p.append(0)
             obj = obj[0]
-            continue
-        if isinstance(obj, dict) and len(obj) == 1:
-            k = next(iter(obj))
-            p = p + (k,)
-            obj = obj[k]
-            continue
-        return p
+        elif t is dict and len(obj) == 1:
+            ((k, obj),) = obj.items()
+            p.append(k)
+        else:
+            return tuple(p)
 
-def label_for(p, kind, obj):
+_TYPE_MARK = {dict: "{}", list: "[]"}
+
+def _node_label(k, kind, obj):
     # show keys/indices and type markers
+    t = type(obj)
     if kind == "root":
-        if isinstance(obj, dict):
-            return "root {}"
-        if isinstance(obj, list):
-            return "root []"
-        return "root"
-    k = last_key(p)
+        return f"root {_TYPE_MARK[t]}" if t in _TYPE_MARK else "root"
     if kind == "object-key":
-        if isinstance(obj, dict):
-            t = "{}" if isinstance(obj, dict) else "[]" if isinstance(obj, list) else "leaf"
-            return f"{k!r}: {t}"
+        if t is dict:
+            return f"{k!r}: {{}}"
         return f"{k!r}"
     if kind == "array-element":
-        t = "{}" if isinstance(obj, dict) else "[]" if isinstance(obj, list) else "leaf"
-        return f"[{k}]: {t}"
+        return f"[{k}]: {_TYPE_MARK.get(t, 'leaf')}"
     if kind == "object":
         return "{}"
     if kind == "array":
@@ -314,7 +622,7 @@ def _derive_text_mode(doc, path):
     if doc is None or path is None:
         return "json"
     try:
-        obj = get_at_path(doc, path)
+        obj = lookup_path(doc, path)
         return "value" if isinstance(obj, str) else "json"
     except Exception:
         return "json"
@@ -325,10 +633,10 @@ def _kind_of(doc, path):
     if path == tuple():
         return "root"
     pp = parent_path(path)
-    parent = get_at_path(doc, pp)
-    if isinstance(parent, dict):
+    t = type(lookup_path(doc, pp))
+    if t is dict:
         return "object-key"
-    if isinstance(parent, list):
+    if t is list:
         return "array-element"
     return "value"
 
@@ -347,7 +655,7 @@ def reducer(state, action):
             "text_mode": _derive_text_mode(action["doc"], tuple()),
             "status_validity": "reloaded" if t == "RELOAD_DOC" else "loaded",
             "status_error": "",
-            "find_term": None, "find_matches": [], "find_index": -1,
+            "find_term": None, "find_matches": [], "find_iter": None, "find_index": -1,
         }
     if t == "LOAD_FROM_CLIPBOARD":
         return {**state,
@@ -356,7 +664,7 @@ def reducer(state, action):
             "dirty": 0,
             "text_mode": _derive_text_mode(action["doc"], tuple()),
             "status_validity": "created", "status_error": "",
-            "find_term": None, "find_matches": [], "find_index": -1,
+            "find_term": None, "find_matches": [], "find_iter": None, "find_index": -1,
         }
     if t == "SAVE_DONE":
         return {**state,
@@ -390,7 +698,7 @@ def reducer(state, action):
     if t == "FIND_START":
         s = {**state,
             "find_term": action["term"], "find_matches": action["matches"],
-            "find_index": action["index"],
+            "find_iter": action["iter"], "find_index": action["index"],
             "selected_path": action["selected_path"], "selected_kind": action["selected_kind"],
             "status_error": action["status_error"],
         }
@@ -398,6 +706,7 @@ def reducer(state, action):
         return s
     if t == "FIND_ADVANCE":
         s = {**state,
+            "find_matches": action["matches"], "find_iter": action["iter"],
             "find_index": action["index"],
             "selected_path": action["selected_path"], "selected_kind": action["selected_kind"],
             "status_error": action["status_error"],
@@ -405,15 +714,17 @@ def reducer(state, action):
         s["text_mode"] = _derive_text_mode(s["doc"], s["selected_path"])
         return s
     if t == "FIND_CLEAR":
-        return {**state, "find_term": None, "find_matches": [], "find_index": -1,
+        return {**state, "find_term": None, "find_matches": [], "find_iter": None, "find_index": -1,
                 "status_error": action["status_error"]}
     if t == "SET_STATUS":
-        s = dict(state)
+        changes = {}
         if action.get("validity") is not None:
-            s["status_validity"] = action["validity"]
+            changes["status_validity"] = action["validity"]
         if action.get("error") is not None:
-            s["status_error"] = action["error"]
-        return s
+            changes["status_error"] = action["error"]
+        if all(state[k] == v for k, v in changes.items()):
+            return state  # nothing to copy, nothing to realize
+        return {**state, **changes}
     return state
 
 
@@ -421,10 +732,18 @@ def reducer(state, action):
 # dispatch
 # ----------------------------
 
+_LOAD_ACTIONS = ("LOAD_DOC", "RELOAD_DOC", "LOAD_FROM_CLIPBOARD")
+
 def dispatch(action):
     global g_state
+    g_path_cache.clear()
     old = g_state
     new = reducer(old, action)
+    if new["doc"] is not old["doc"]:
+        # don't keep the replaced doc (and its key index) alive until the next find
+        g_key_index["doc"] = g_key_index["index"] = None
+        if action["type"] in _LOAD_ACTIONS:
+            g_parse_cache["text"] = g_parse_cache["obj"] = None
     realize(old, new, action)
     g_state = new
 
@@ -438,82 +757,251 @@ def _new_iid():
     g_widget_state["_iid_counter"] = c
     return f"n{c}"
 
-def _insert_node(doc, parent_iid, p, kind):
-    obj = get_at_path(doc, p) if p is not None else doc
+def _insert_node(parent_iid, key, kind, obj, index="end"):
     iid = _new_iid()
-    txt = label_for(p, kind, obj)
-    widgets["tree"].insert(parent_iid, "end", iid=iid, text=txt)
-    g_widget_state["iid_to_path"][iid] = p
+    widgets["tree"].insert(parent_iid, index, iid=iid, text=_node_label(key, kind, obj))
+    g_widget_state["iid_link"][iid] = (parent_iid, key)
     g_widget_state["iid_to_kind"][iid] = kind
-    g_widget_state["path_to_iid"][p] = iid
+    if parent_iid:
+        g_widget_state["children_of"].setdefault(parent_iid, {})[key] = iid
     return iid
 
-def _remember_expanded_paths():
-    g_widget_state["expanded_paths"].clear()
-
-    def walk(iid):
-        if widgets["tree"].item(iid, "open"):
-            p = g_widget_state["iid_to_path"].get(iid)
-            if p is not None:
-                g_widget_state["expanded_paths"].add(p)
-        for c in widgets["tree"].get_children(iid):
-            walk(c)
+def _insert_subtree(parent_iid, key, kind, obj, index="end"):
+    """Inserts obj below parent_iid; its children wait until it is opened."""
+    iid = _insert_node(parent_iid, key, kind, obj, index)
+    _insert_children_or_placeholder(iid, obj, False)
+    return iid
 
-    for iid in widgets["tree"].get_children(""):
-        walk(iid)
+def _insert_children_or_placeholder(iid, obj, is_open):
+    # closed containers get a placeholder; their children are inserted when first opened
+    if is_open or not obj or type(obj) not in _TYPE_MARK:
+        _insert_children(iid, obj)
+        return
+    widgets["tree"].insert(iid, "end", iid=iid + ":lazy", text="…")
+    g_widget_state["unpopulated"].add(iid)
 
-def _restore_expanded_paths():
-    for p in list(g_widget_state["expanded_paths"]):
-        iid = g_widget_state["path_to_iid"].get(p)
-        if iid:
-            widgets["tree"].item(iid, open=True)
+def _populate(iid):
+    """Replaces iid's placeholder with its real children."""
+    if iid not in g_widget_state["unpopulated"]:
+        return
+    g_widget_state["unpopulated"].discard(iid)
+    widgets["tree"].delete(iid + ":lazy")
+    _insert_children(iid, get_at_path(g_widget_state["tree_doc"], _path_for_iid(iid)))
+
+def _insert_children(iid, obj):
+    t = type(obj)
+    if t is dict:
+        for k, v in obj.items():
+            _insert_subtree(iid, k, "object-key", v)
+    elif t is list:
+        for i, v in enumerate(obj):
+            _insert_subtree(iid, i, "array-element", v)
+
+def _path_for_iid(iid):
+    """Walks iid_link up to the root; None for an iid the tree does not know."""
+    link = g_widget_state["iid_link"]
+    if iid not in link:
+        return None
+    keys = []
+    parent, k = link[iid]
+    while parent:
+        keys.append(k)
+        parent, k = link[parent]
+    keys.reverse()
+    return intern_path(tuple(keys))
 
 def _rebuild_tree(doc):
-    """Replaces build_tree + refresh_tree; preserves expanded paths."""
-    _remember_expanded_paths()
-
+    """Replaces build_tree + refresh_tree."""
     widgets["tree"].delete(*widgets["tree"].get_children(""))
-    g_widget_state["path_to_iid"].clear()
-    g_widget_state["iid_to_path"].clear()
+    g_widget_state["children_of"].clear()
+    g_widget_state["iid_link"].clear()
     g_widget_state["iid_to_kind"].clear()
+    g_widget_state["unpopulated"].clear()
+    g_widget_state["expanded_iids"].clear()
+    g_widget_state["root_iid"] = None
+    g_widget_state["tree_doc"] = doc
 
     if doc is None:
         return
 
-    root_path = tuple()
-    root_iid = _insert_node(doc, "", root_path, "root")
+    # fill the root in while it is detached, so Tk lays the tree out once on re-attach
+    root_iid = _insert_node("", None, "root", doc)
+    g_widget_state["root_iid"] = root_iid
+    widgets["tree"].detach(root_iid)
+    _insert_children_or_placeholder(root_iid, doc, False)
+    widgets["tree"].move(root_iid, "", 0)
+
+def _child_items(obj):
+    t = type(obj)
+    if t is dict:
+        return list(obj.items())
+    if t is list:
+        return list(enumerate(obj))
+    return []
+
+def _forget_subtree(iid):
+    """Drops the widget-state entries for a subtree already deleted from the tree."""
+    children_of = g_widget_state["children_of"]
+    stack = [iid]
+    while stack:
+        iid = stack.pop()
+        kids = children_of.pop(iid, None)
+        if kids:
+            stack.extend(kids.values())
+        g_widget_state["iid_link"].pop(iid, None)
+        g_widget_state["iid_to_kind"].pop(iid, None)
+        g_widget_state["unpopulated"].discard(iid)
+        g_widget_state["expanded_iids"].discard(iid)
+
+def _longest_increasing_run(seq):
+    """Returns the set of values forming a longest increasing subsequence of seq."""
+    tails, tail_idx, prev = [], [], [None] * len(seq)
+    for i, x in enumerate(seq):
+        lo, hi = 0, len(tails)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if tails[mid] < x:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == len(tails):
+            tails.append(x)
+            tail_idx.append(i)
+        else:
+            tails[lo] = x
+            tail_idx[lo] = i
+        prev[i] = tail_idx[lo - 1] if lo > 0 else None
+    keep = set()
+    i = tail_idx[-1] if tail_idx else None
+    while i is not None:
+        keep.add(seq[i])
+        i = prev[i]
+    return keep
+
+def _reconcile_children(iid, old, new):
+    """Diffs the children of one container node, emitting minimal Tk updates."""
+    tree = widgets["tree"]
+    kind = "object-key" if type(new) is dict else "array-element"
+    old_items = _child_items(old)
+    new_items = _child_items(new)
+
+    # match each new child to an old one: same key for objects and identity
+    # for arrays first, then identity (renames) or same position (edits)
+    unmatched = {}
+    for i, (k, v) in enumerate(old_items):
+        unmatched.setdefault(id(v), []).append(i)
+    old_pos = {k: i for i, (k, v) in enumerate(old_items)} if type(old) is dict else None
+    taken = [False] * len(old_items)
+    match = [None] * len(new_items)
+
+    def take(j, i):
+        match[j] = i
+        taken[i] = True
+
+    if old_pos is not None:
+        for j, (k, v) in enumerate(new_items):
+            i = old_pos.get(k)
+            if i is not None:
+                take(j, i)
+    for j, (k, v) in enumerate(new_items):
+        if match[j] is not None:
+            continue
+        for i in unmatched.get(id(v), ()):
+            if not taken[i]:
+                take(j, i)
+                break
+    if old_pos is None:
+        for j in range(len(new_items)):
+            if match[j] is None and j < len(old_items) and not taken[j]:
+                take(j, j)
+
+    old_kids = g_widget_state["children_of"].get(iid, {})
+    old_iids = [old_kids[k] for k, v in old_items]
+
+    for i in range(len(old_items)):
+        if not taken[i]:
+            tree.delete(old_iids[i])
+            _forget_subtree(old_iids[i])
+
+    # children are linked by (parent iid, key), so a renamed or shifted child
+    # only needs its own link updated, never its descendants'
+    kids = g_widget_state["children_of"][iid] = {}
+    link = g_widget_state["iid_link"]
+    keep = _longest_increasing_run([i for i in match if i is not None])
+    for i in match:
+        if i is not None and i not in keep:
+            tree.detach(old_iids[i])
+    for j, ((k, v), i) in enumerate(zip(new_items, match)):
+        if i is None:
+            _insert_subtree(iid, k, kind, v, j)
+            continue
+        child = old_iids[i]
+        kids[k] = child
+        link[child] = (iid, k)
+        if i not in keep:
+            tree.move(child, iid, j)
+        _reconcile_node(child, old_items[i][0], k, kind, old_items[i][1], v)
+
+def _reconcile_node(iid, old_key, key, kind, old, new):
+    txt = _node_label(key, kind, new)
+    if txt != _node_label(old_key, kind, old):
+        widgets["tree"].item(iid, text=txt)
+    if old is new:
+        return
+    if iid in g_widget_state["unpopulated"]:
+        # children were never materialized; only the placeholder has to follow new
+        if not new or type(new) not in _TYPE_MARK:
+            g_widget_state["unpopulated"].discard(iid)
+            widgets["tree"].delete(iid + ":lazy")
+        return
+    old_container = type(old) in _TYPE_MARK
+    if old_container and type(old) is type(new):
+        _reconcile_children(iid, old, new)
+        return
+    if old_container:
+        widgets["tree"].delete(*widgets["tree"].get_children(iid))
+        for child in g_widget_state["children_of"].pop(iid, {}).values():
+            _forget_subtree(child)
+    _insert_children_or_placeholder(iid, new, iid in g_widget_state["expanded_iids"])
+
+def _reconcile_tree(old_doc, new_doc):
+    """Updates the tree from old_doc to new_doc, touching only changed subtrees."""
+    root_iid = g_widget_state["root_iid"]
+    if old_doc is None or new_doc is None or root_iid is None:
+        _rebuild_tree(new_doc)
+        return
+    g_widget_state["tree_doc"] = new_doc
+    _reconcile_node(root_iid, None, None, "root", old_doc, new_doc)
 
-    def rec(parent_iid, p):
-        obj = get_at_path(doc, p)
-        if isinstance(obj, dict):
-            for k in obj.keys():
-                cp = p + (k,)
-                kid = _insert_node(doc, parent_iid, cp, "object-key")
-                rec(kid, cp)
-        elif isinstance(obj, list):
-            for i in range(len(obj)):
-                cp = p + (i,)
-                kid = _insert_node(doc, parent_iid, cp, "array-element")
-                rec(kid, cp)
-
-    rec(root_iid, root_path)
-    _restore_expanded_paths()
+def _open_node(iid):
+    _populate(iid)
+    if iid not in g_widget_state["expanded_iids"]:
+        widgets["tree"].item(iid, open=True)
+        g_widget_state["expanded_iids"].add(iid)
 
 def _expand_tree_to_path(p):
-    if p is None:
-        return
-    cur = tuple()
-    while True:
-        iid = g_widget_state["path_to_iid"].get(cur)
-        if iid:
-            widgets["tree"].item(iid, open=True)
-        if cur == p:
-            break
-        cur = cur + (p[len(cur)],)
+    """Opens every node down to p; returns p's iid, or None if p is not in the tree."""
+    iid = g_widget_state["root_iid"]
+    if p is None or iid is None:
+        return None
+    children_of = g_widget_state["children_of"]
+    _open_node(iid)
+    for k in p:
+        iid = children_of.get(iid, {}).get(k)
+        if iid is None:
+            return None
+        _open_node(iid)
+    return iid
 
 def _sync_tree_selection(path):
     """Replaces select_path widget part; uses suppress_tree_select guard."""
-    iid = g_widget_state["path_to_iid"].get(path)
+    if path:
+        # open (and materialize) the ancestors ourselves, so expanded_iids sees it;
+        # the walk down ends at the parent, one hop from the node itself
+        parent_iid = _expand_tree_to_path(parent_path(path))
+        iid = g_widget_state["children_of"].get(parent_iid, {}).get(path[-1])
+    else:
+        iid = g_widget_state["root_iid"] if path is not None else None
     if not iid:
         return
     g_widget_state["suppress_tree_select"] += 1
@@ -540,6 +1028,37 @@ def set_text(s, cursor="start"):
 
     t.tag_remove("sel", "1.0", "end") if cursor == "start" else None
     t.edit_modified(False)
+    g_widget_state["text_dirty"] = False
+
+def _text_cache_for(doc):
+    if g_text_cache["doc"] is not doc:
+        g_text_cache["doc"] = doc
+        g_text_cache["texts"].clear()
+        g_text_cache["copies"].clear()
+        g_text_cache["odd_floats"].clear()
+    return g_text_cache
+
+def _subtree_text(doc, path, obj):
+    """pretty_fast(obj), remembered per path for as long as doc stays current."""
+    texts = _text_cache_for(doc)["texts"]
+    if len(texts) >= TEXT_CACHE_LIMIT:
+        texts.clear()
+    s = texts.get(path)
+    if s is None:
+        s = texts[path] = pretty_fast(obj, lambda o: _odd_floats_at(doc, path, o))
+    return s
+
+def _odd_floats_at(doc, path, obj):
+    """has_odd_float(obj) for the subtree at path, remembered while doc stays current."""
+    seen = _text_cache_for(doc)["odd_floats"]
+    if seen.get(tuple()) is False:
+        return False  # nothing under a root without odd floats can have one
+    r = seen.get(path)
+    if r is None:
+        if len(seen) >= TEXT_CACHE_LIMIT:
+            seen.clear()
+        r = seen[path] = has_odd_float(obj)
+    return r
 
 def _refresh_text_pane(state, action=None):
     """Replaces refresh_text_for_path."""
@@ -557,12 +1076,12 @@ def _refresh_text_pane(state, action=None):
         set_text("", cursor="start")
         return
 
-    obj = get_at_path(doc, path) if path is not None else doc
+    obj = lookup_path(doc, path) if path is not None else doc
 
     if isinstance(obj, str):
         set_text(obj, cursor=cursor)
     else:
-        set_text(pretty(obj, indent=2), cursor=cursor)
+        set_text(_subtree_text(doc, path, obj), cursor=cursor)
 
 def _refresh_menu_enablement(state):
     """Replaces refresh_menu_enablement; takes state not globals."""
@@ -630,10 +1149,8 @@ def _update_dirty_indicator(dirty):
 def realize(old, new, action=None):
     doc_changed = (new["doc"] is not old["doc"])
 
-    _LOAD_ACTIONS = ("LOAD_DOC", "RELOAD_DOC", "LOAD_FROM_CLIPBOARD")
-
     if doc_changed:
-        _rebuild_tree(new["doc"])
+        _reconcile_tree(old["doc"], new["doc"])
         if action and action["type"] in _LOAD_ACTIONS:
             _expand_tree_to_path(first_bifurcation_path(new["doc"]))
         _sync_tree_selection(new["selected_path"])
@@ -671,15 +1188,27 @@ def handle_tree_selection_changed(event=None):
     if not sel:
         return
     iid = sel[0]
-    p = g_widget_state["iid_to_path"].get(iid)
+    p = _path_for_iid(iid)
     kind = g_widget_state["iid_to_kind"].get(iid)
-    if p == g_state["selected_path"]:
+    if p is None or p == g_state["selected_path"]:
         return
     dispatch({"type": "SELECT_PATH", "path": p, "kind": kind})
 
+def handle_tree_open(event=None):
+    iid = widgets["tree"].focus()
+    if iid in g_widget_state["iid_link"]:
+        _populate(iid)
+        g_widget_state["expanded_iids"].add(iid)
+
+def handle_tree_close(event=None):
+    g_widget_state["expanded_iids"].discard(widgets["tree"].focus())
+
 def handle_text_modified(event=None):
-    if widgets["text"].edit_modified():
-        dispatch({"type": "SET_STATUS", "validity": "(uncommitted edits)", "error": None})
+    if not widgets["text"].edit_modified():
+        return
+    # edit_modified() stays set until the next set_text, so this runs once per edit session
+    g_widget_state["text_dirty"] = True
+    dispatch({"type": "SET_STATUS", "validity": "(uncommitted edits)", "error": None})
 
 
 # ----------------------------
@@ -706,7 +1235,7 @@ def handle_reload_file_command():
 def open_file(p: Path):
     is_reloading = (p == g_state["file_path"])
     try:
-        s = p.read_text(encoding="utf-8")
+        s = p.read_bytes()
     except Exception as e:
         messagebox.showerror("Open", f"Could not read file:\n{e}")
         return
@@ -799,19 +1328,28 @@ def write_clipboard(s):
     root.clipboard_clear()
     root.clipboard_append(s)
 
+def _copy_text(doc, path, flags):
+    """The clipboard text for the subtree at path, remembered while doc stays current."""
+    copies = _text_cache_for(doc)["copies"]
+    s = copies.get((path, flags))
+    if s is None:
+        if len(copies) >= TEXT_CACHE_LIMIT:
+            copies.clear()
+        obj = lookup_path(doc, path)
+        scan = lambda o: _odd_floats_at(doc, path, o)
+        s = copies[(path, flags)] = pretty_fast(obj, scan) if flags != "C" else compact_fast(obj, scan)
+    return s
+
 def copy_entire_document(flags="P"):
     if g_state["doc"] is None:
         return
-    s = pretty(g_state["doc"], indent=2) if flags != "C" else compact(g_state["doc"])
-    write_clipboard(s)
+    write_clipboard(_copy_text(g_state["doc"], tuple(), flags))
     dispatch({"type": "SET_STATUS", "validity": "copied", "error": ""})
 
 def copy_selected_subtree(flags="P"):
     if g_state["doc"] is None or g_state["selected_path"] is None:
         return
-    obj = get_at_path(g_state["doc"], g_state["selected_path"])
-    s = pretty(obj, indent=2) if flags != "C" else compact(obj)
-    write_clipboard(s)
+    write_clipboard(_copy_text(g_state["doc"], g_state["selected_path"], flags))
     dispatch({"type": "SET_STATUS", "validity": "copied node", "error": ""})
 
 
@@ -827,23 +1365,29 @@ def apply_text_to_tree(event=None):
     p = g_state["selected_path"]
     if g_state["text_mode"] == "value":
         obj, err = s, None
+    elif s == g_parse_cache["text"]:
+        # committing the same text again; docs are never mutated, so the parse can be shared
+        obj, err = g_parse_cache["obj"], None
     else:
         obj, err = parse_json_text(s)
     if err:
         dispatch({"type": "COMMIT_FAIL", "error": str(err)})
         return "break"
+    if g_state["text_mode"] != "value":
+        g_parse_cache["text"] = s
+        g_parse_cache["obj"] = obj
 
     if p == tuple():
         if not isinstance(obj, (dict, list)):
             dispatch({"type": "COMMIT_FAIL", "error": "Root must be {} or []."})
             return "break"
 
-    # Build new_doc via deepcopy then mutate so doc identity always changes
-    new_doc = copy.deepcopy(g_state["doc"])
+    # Copy only the spine above p so doc identity always changes
     if p == tuple():
-        new_doc = obj
+        new_doc = obj if obj is not g_state["doc"] else shallow_copy(obj)
     else:
-        set_at_path(new_doc, p, obj)
+        new_doc, parent = clone_along_path(g_state["doc"], parent_path(p))
+        parent[last_key(p)] = obj
 
     dispatch({"type": "COMMIT_TEXT", "doc": new_doc})
     return "break"
@@ -891,8 +1435,7 @@ def _move_structural_item(direction):
     if pp is None:
         return
 
-    new_doc = copy.deepcopy(g_state["doc"])
-    parent = get_at_path(new_doc, pp)
+    new_doc, parent = clone_along_path(g_state["doc"], pp)
     action_type = "RAISE_ITEM" if direction == -1 else "LOWER_ITEM"
 
     if isinstance(parent, list):
@@ -903,22 +1446,20 @@ def _move_structural_item(direction):
         parent[i], parent[j] = parent[j], parent[i]
         np = pp + (j,)
         dispatch({"type": action_type, "doc": new_doc,
-                  "selected_path": np, "selected_kind": _kind_of(new_doc, np)})
+                  "selected_path": np, "selected_kind": "array-element"})
         return
 
     if isinstance(parent, dict):
         k = last_key(p)
-        keys = list(parent.keys())
-        if len(keys) <= 1:
+        n = len(parent)
+        if n <= 1:
             return
-        i = keys.index(k)
-        j = (i + direction) % len(keys)
-        keys[i], keys[j] = keys[j], keys[i]
-        new_parent = {kk: parent[kk] for kk in keys}
-        new_doc = set_at_path(new_doc, pp, new_parent)
+        i = next(ii for ii, kk in enumerate(parent) if kk == k)
+        j = (i + direction) % n
+        swap_dict_keys(parent, min(i, j), max(i, j))
         np = pp + (k,)
         dispatch({"type": action_type, "doc": new_doc,
-                  "selected_path": np, "selected_kind": _kind_of(new_doc, np)})
+                  "selected_path": np, "selected_kind": "object-key"})
 
 def raise_structural_item():
     _move_structural_item(-1)
@@ -934,16 +1475,15 @@ def insert_structural_item_after():
         return
     p = g_state["selected_path"]
     pp = parent_path(p)
-
-    new_doc = copy.deepcopy(g_state["doc"])
-    parent = get_at_path(new_doc, pp)
+    parent = lookup_path(g_state["doc"], pp)
 
     if isinstance(parent, list):
+        new_doc, parent = clone_along_path(g_state["doc"], pp)
         i = last_key(p)
         parent.insert(i + 1, None)
         np = pp + (i + 1,)
         dispatch({"type": "INSERT_AFTER", "doc": new_doc,
-                  "selected_path": np, "selected_kind": _kind_of(new_doc, np)})
+                  "selected_path": np, "selected_kind": "array-element"})
         widgets["text"].focus_set()
         return
 
@@ -956,20 +1496,10 @@ def insert_structural_item_after():
             messagebox.showerror("New JSON Key", "Key already exists in this object.")
             return
 
-        keys = list(parent.keys())
-        i = keys.index(oldk)
-        keys.insert(i + 1, k)
-
-        new_parent = {}
-        for kk in keys:
-            if kk == k:
-                new_parent[kk] = None
-            else:
-                new_parent[kk] = parent[kk]
-        new_doc = set_at_path(new_doc, pp, new_parent)
+        new_doc = replace_along_path(g_state["doc"], pp, dict_insert_after(parent, oldk, k, None))
         np = pp + (k,)
         dispatch({"type": "INSERT_AFTER", "doc": new_doc,
-                  "selected_path": np, "selected_kind": _kind_of(new_doc, np)})
+                  "selected_path": np, "selected_kind": "object-key"})
         widgets["text"].focus_set()
         return
 
@@ -981,16 +1511,15 @@ def duplicate_structural_item():
         return
     p = g_state["selected_path"]
     pp = parent_path(p)
-
-    new_doc = copy.deepcopy(g_state["doc"])
-    parent = get_at_path(new_doc, pp)
+    parent = lookup_path(g_state["doc"], pp)
 
     if isinstance(parent, list):
+        new_doc, parent = clone_along_path(g_state["doc"], pp)
         i = last_key(p)
         parent.insert(i + 1, deep_copy(parent[i]))
         np = pp + (i + 1,)
         dispatch({"type": "DUPLICATE", "doc": new_doc,
-                  "selected_path": np, "selected_kind": _kind_of(new_doc, np)})
+                  "selected_path": np, "selected_kind": "array-element"})
         widgets["tree"].focus_set()
         return
 
@@ -1003,20 +1532,11 @@ def duplicate_structural_item():
             messagebox.showerror("New JSON Key", "Key already exists in this object.")
             return
 
-        keys = list(parent.keys())
-        i = keys.index(oldk)
-        keys.insert(i + 1, k)
-
-        new_parent = {}
-        for kk in keys:
-            if kk == k:
-                new_parent[kk] = deep_copy(parent[oldk])
-            else:
-                new_parent[kk] = parent[kk]
-        new_doc = set_at_path(new_doc, pp, new_parent)
+        new_parent = dict_insert_after(parent, oldk, k, deep_copy(parent[oldk]))
+        new_doc = replace_along_path(g_state["doc"], pp, new_parent)
         np = pp + (k,)
         dispatch({"type": "DUPLICATE", "doc": new_doc,
-                  "selected_path": np, "selected_kind": _kind_of(new_doc, np)})
+                  "selected_path": np, "selected_kind": "object-key"})
         widgets["tree"].focus_set()
         return
 
@@ -1027,9 +1547,7 @@ def rename_structural_key():
         return
     p = g_state["selected_path"]
     pp = parent_path(p)
-
-    new_doc = copy.deepcopy(g_state["doc"])
-    parent = get_at_path(new_doc, pp)
+    parent = lookup_path(g_state["doc"], pp)
 
     if not isinstance(parent, dict):
         return
@@ -1044,26 +1562,15 @@ def rename_structural_key():
         messagebox.showerror("Rename Key", "Key already exists in this object.")
         return
 
-    keys = list(parent.keys())
-    i = keys.index(oldk)
-    keys[i] = k
-
-    val = parent[oldk]
-    new_parent = {}
-    for kk in keys:
-        if kk == k:
-            new_parent[kk] = val
-        else:
-            new_parent[kk] = parent[kk]
-    new_doc = set_at_path(new_doc, pp, new_parent)
+    new_doc = replace_along_path(g_state["doc"], pp, dict_rename_key(parent, oldk, k))
 
     np = pp + (k,)
     dispatch({"type": "RENAME_KEY", "doc": new_doc,
-              "selected_path": np, "selected_kind": _kind_of(new_doc, np),
+              "selected_path": np, "selected_kind": "object-key",
               "suppress_text_refresh": True})
 
 def pick_selection_after_delete(doc, pp, removed_key):
-    parent = get_at_path(doc, pp)
+    parent = lookup_path(doc, pp)  # memoized, so the _kind_of that follows is free
 
     if isinstance(parent, list):
         n = len(parent)
@@ -1071,16 +1578,15 @@ def pick_selection_after_delete(doc, pp, removed_key):
             return pp, "parent"
         i = removed_key
         if i < n:
-            return pp + (i,), "next-sibling"
+            return intern_path(pp + (i,)), "next-sibling"
         if i - 1 >= 0:
-            return pp + (i - 1,), "previous-sibling"
+            return intern_path(pp + (i - 1,)), "previous-sibling"
         return pp, "parent"
 
     if isinstance(parent, dict):
-        keys = list(parent.keys())
-        if not keys:
+        if not parent:
             return pp, "parent"
-        return pp + (keys[-1],), "previous-sibling"
+        return intern_path(pp + (next(reversed(parent)),)), "previous-sibling"
 
     return pp, "parent"
 
@@ -1100,11 +1606,11 @@ def delete_structural_item():
 
     removed = last_key(p)
 
-    # Check edit_modified BEFORE dispatch (invariant 4)
-    text_has_uncommitted = widgets["text"].edit_modified()
+    # Check for uncommitted text BEFORE dispatch (invariant 4)
+    text_has_uncommitted = g_widget_state["text_dirty"]
 
-    new_doc = copy.deepcopy(g_state["doc"])
-    delete_at_path(new_doc, p)
+    new_doc, new_parent = clone_along_path(g_state["doc"], pp)
+    del new_parent[removed]
 
     # Decide new selection
     np, classification = pick_selection_after_delete(new_doc, pp, removed)
@@ -1127,8 +1633,7 @@ def add_clipboard_kv_pair():
 
     key, value = pair
     selected_path = g_state["selected_path"]
-    new_doc = copy.deepcopy(g_state["doc"])
-    target = get_at_path(new_doc, selected_path)
+    new_doc, target = clone_along_path(g_state["doc"], selected_path)
     target[key] = deep_copy(value)
 
     dispatch({"type": "COMMIT_TEXT", "doc": new_doc})
@@ -1140,8 +1645,7 @@ def update_dictionary_from_clipboard():
         return
 
     selected_path = g_state["selected_path"]
-    new_doc = copy.deepcopy(g_state["doc"])
-    target = get_at_path(new_doc, selected_path)
+    new_doc, target = clone_along_path(g_state["doc"], selected_path)
     for key, value in updates.items():
         target[key] = deep_copy(value)
 
@@ -1165,25 +1669,40 @@ def action_find_key():
         return
 
     # New term → new session
-    matches = []
-    collect_key_paths(g_state["doc"], [], term, matches)
+    matches, it = _start_find(g_state["doc"], term)
 
     if not matches:
         dispatch({"type": "FIND_CLEAR",
                   "status_error": f'Find "{term}": no matches'})
         return
 
-    match_tuples = [tuple(p) for p in matches]
-    first_path = match_tuples[0]
-    first_kind = _kind_of(g_state["doc"], first_path)
+    first_path = matches[0]
+    first_kind = "object-key"  # find only matches object keys
 
     dispatch({"type": "FIND_START",
               "term": term,
-              "matches": match_tuples,
+              "matches": matches,
+              "iter": it,
               "index": 0,
               "selected_path": first_path,
               "selected_kind": first_kind,
-              "status_error": f'Find "{term}": 1 of {len(match_tuples)}'})
+              "status_error": f'Find "{term}": 1 of {_find_count(matches, it)}'})
+
+def _start_find(doc, term):
+    """Returns (matches, it) for a new find session on doc.
+
+    The first term searched in a doc is walked lazily, one match ahead of
+    the cursor, so the first hit shows quickly. A second new term pays for
+    one full walk that indexes every key; later terms are read from that
+    index, with paths rebuilt one match ahead of the cursor as well.
+    """
+    if g_key_index["doc"] is not doc:
+        g_key_index["doc"] = doc
+        g_key_index["index"] = None
+        return _pull_find_matches([], iter_key_paths(doc, term), 1)
+    if g_key_index["index"] is None:
+        g_key_index["index"] = build_key_index(doc)
+    return _pull_find_matches([], iter_indexed_paths(g_key_index["index"], term), 1)
 
 def action_repeat_find_key():
     if not g_state["find_matches"]:
@@ -1191,30 +1710,55 @@ def action_repeat_find_key():
         return
     _do_find_advance()
 
+def _pull_find_matches(matches, it, upto):
+    """Realizes matches from it until index upto exists; returns (matches, it), it=None once dry.
+
+    matches is the session's own list, like it, and is extended in place.
+    """
+    append = matches.append
+    while it is not None and len(matches) <= upto:
+        p = next(it, None)
+        if p is None:
+            it = None
+        else:
+            append(p)
+    return matches, it
+
+def _find_count(matches, it):
+    return str(len(matches)) if it is None else f"{len(matches)}+"
+
 def _do_find_advance():
-    matches = g_state["find_matches"]
-    term = g_state["find_term"]
+    state = g_state
+    matches = state["find_matches"]
+    term = state["find_term"]
 
     if not matches:
         dispatch({"type": "SET_STATUS", "validity": None, "error": "No active search"})
         return
 
-    new_index = g_state["find_index"] + 1
+    new_index = state["find_index"] + 1
     wrapped = False
 
+    matches, it = _pull_find_matches(matches, state["find_iter"], new_index + 1)
     if new_index >= len(matches):
         new_index = 0
         wrapped = True
 
     path = matches[new_index]
-    kind = _kind_of(g_state["doc"], path)
+    if state["doc"] is g_key_index["doc"]:
+        kind = "object-key"  # every match is an object key in the doc it was found in
+    else:
+        kind = _kind_of(state["doc"], path)
+    count = _find_count(matches, it)
 
     if wrapped:
-        status_error = f'Find "{term}": wrapped (1 of {len(matches)})'
+        status_error = f'Find "{term}": wrapped (1 of {count})'
     else:
-        status_error = f'Find "{term}": {new_index + 1} of {len(matches)}'
+        status_error = f'Find "{term}": {new_index + 1} of {count}'
 
     dispatch({"type": "FIND_ADVANCE",
+              "matches": matches,
+              "iter": it,
               "index": new_index,
               "selected_path": path,
               "selected_kind": kind,
@@ -1225,65 +1769,66 @@ def _do_find_advance():
 # help
 # ----------------------------
 
+_HELP_TEXT = "\n".join([
+    "JSON Tree Editor lets you explore and safely edit JSON documents using a tree view and a text editor side by side.",
+    "",
+    "BASIC WORKFLOW",
+    "",
+    "1. Load JSON into the program:",
+    "   • Use File | Open to load a JSON file, or",
+    "   • Use File | Create from Clipboard to paste JSON from the clipboard.",
+    "",
+    "2. Navigate the JSON structure:",
+    "   • Click nodes in the tree on the left to select a portion of the JSON.",
+    "   • The selected subtree will appear as editable text on the right.",
+    "",
+    "3. Edit JSON text:",
+    "   • Modify the text in the editor pane on the right.",
+    "   • You may freely edit, reformat, or replace the JSON subtree.",
+    "",
+    "4. Commit your changes:",
+    "   • Press Ctrl+Enter, or",
+    "   • Click the 'Update Tree' button.",
+    "   • The tree view will refresh to reflect your changes.",
+    "",
+    "5. Export JSON:",
+    "   • Use 'Copy Tree' to copy the entire document (pretty-printed).",
+    "   • Use 'Copy Tree (compressed)' to copy compact JSON.",
+    "   • Use 'Copy Node' to copy only the selected subtree.",
+    "   • Use File | Save to write the document to disk.",
+    "",
+    "IMPORTANT WARNING",
+    "",
+    "Edits made in the text pane are NOT automatically committed.",
+    "Your changes are only applied when you explicitly commit them",
+    "using Ctrl+Enter or the 'Update Tree' button.",
+    "",
+    "If you navigate away from a node without committing,",
+    "your edits will be lost.",
+])
+
 def display_help():
-    s = "\n".join([
-        "JSON Tree Editor lets you explore and safely edit JSON documents using a tree view and a text editor side by side.",
-        "",
-        "BASIC WORKFLOW",
-        "",
-        "1. Load JSON into the program:",
-        "   • Use File | Open to load a JSON file, or",
-        "   • Use File | Create from Clipboard to paste JSON from the clipboard.",
-        "",
-        "2. Navigate the JSON structure:",
-        "   • Click nodes in the tree on the left to select a portion of the JSON.",
-        "   • The selected subtree will appear as editable text on the right.",
-        "",
-        "3. Edit JSON text:",
-        "   • Modify the text in the editor pane on the right.",
-        "   • You may freely edit, reformat, or replace the JSON subtree.",
-        "",
-        "4. Commit your changes:",
-        "   • Press Ctrl+Enter, or",
-        "   • Click the 'Update Tree' button.",
-        "   • The tree view will refresh to reflect your changes.",
-        "",
-        "5. Export JSON:",
-        "   • Use 'Copy Tree' to copy the entire document (pretty-printed).",
-        "   • Use 'Copy Tree (compressed)' to copy compact JSON.",
-        "   • Use 'Copy Node' to copy only the selected subtree.",
-        "   • Use File | Save to write the document to disk.",
-        "",
-        "IMPORTANT WARNING",
-        "",
-        "Edits made in the text pane are NOT automatically committed.",
-        "Your changes are only applied when you explicitly commit them",
-        "using Ctrl+Enter or the 'Update Tree' button.",
-        "",
-        "If you navigate away from a node without committing,",
-        "your edits will be lost.",
-    ])
+    w = widgets.get("help_window")
+    if w is not None and w.winfo_exists():
+        w.deiconify()
+        w.lift()
+        return
 
-    w = tk.Toplevel(widgets["root"])
+    w = widgets["help_window"] = tk.Toplevel(widgets["root"])
     w.title("JSON Tree Editor — Help")
     w.geometry("720x520")
     w.configure(background=THEME_DARK["bg"])
     t = tk.Text(w, wrap="word")
-    t.insert("1.0", s)
-    t.config(
-        state="disabled",
-        background=THEME_DARK["text_bg"],
-        foreground=THEME_DARK["text_fg"],
-        insertbackground=THEME_DARK["text_insert"],
-        selectbackground=THEME_DARK["text_select_bg"],
-        selectforeground=THEME_DARK["text_select_fg"],
-    )
+    t.insert("1.0", _HELP_TEXT)
+    t.config(state="disabled", **_TEXT_THEME)
     t.grid(row=0, column=0, sticky="nsew")
     sb = ttk.Scrollbar(w, command=t.yview)
     sb.grid(row=0, column=1, sticky="ns")
     t.config(yscrollcommand=sb.set)
     w.grid_rowconfigure(0, weight=1)
     w.grid_columnconfigure(0, weight=1)
+    # closing only hides the window, so the next F1 just shows it again
+    w.protocol("WM_DELETE_WINDOW", w.withdraw)
 
 
 # ----------------------------
@@ -1303,13 +1848,7 @@ def edit_script_dialog():
 
     t = tk.Text(w, wrap="none", undo=True, font=("Courier", 10))
     t.insert("1.0", g_script)
-    t.configure(
-        background=THEME_DARK["text_bg"],
-        foreground=THEME_DARK["text_fg"],
-        insertbackground=THEME_DARK["text_insert"],
-        selectbackground=THEME_DARK["text_select_bg"],
-        selectforeground=THEME_DARK["text_select_fg"],
-    )
+    t.configure(**_TEXT_THEME)
     t.grid(row=1, column=0, sticky="nsew", padx=6, pady=(0, 6))
 
     sb = ttk.Scrollbar(w, command=t.yview)
@@ -1348,8 +1887,13 @@ def apply_script(event=None):
     if path is None:
         return "break"
 
-    new_doc = copy.deepcopy(g_state["doc"])
-    obj = get_at_path(new_doc, path)
+    # the script may mutate D in place, so it gets a private copy of the
+    # selected subtree; the rest of the doc is only copied along the path
+    if path == tuple():
+        new_doc = obj = copy.deepcopy(g_state["doc"])
+    else:
+        new_doc, new_parent = clone_along_path(g_state["doc"], parent_path(path))
+        obj = new_parent[path[-1]] = copy.deepcopy(new_parent[path[-1]])
     ns = {"D": obj}
     try:
         exec(g_script, {}, ns)
@@ -1365,7 +1909,7 @@ def apply_script(event=None):
             return "break"
         new_doc = result
     else:
-        set_at_path(new_doc, path, result)
+        new_parent[path[-1]] = result
 
     dispatch({"type": "COMMIT_TEXT", "doc": new_doc})
     dispatch({"type": "SET_STATUS", "validity": "script applied", "error": ""})
@@ -1376,6 +1920,21 @@ def apply_script(event=None):
 # ui construction
 # ----------------------------
 
+# application-wide keys; Tk matches each sequence itself, so ordinary
+# typing never calls into Python
+ACCELERATORS = {
+    "<Control-o>":     handle_open_file_command,
+    "<Control-!>":     handle_reload_file_command,
+    "<Control-s>":     save_file,
+    "<Control-n>":     create_from_clipboard,
+    "<Control-i>":     spawn_new_instance,
+    "<Control-q>":     exit_application,
+    "<Control-h>":     display_help,
+    "<Control-f>":     action_find_key,
+    "<Control-F>":     action_repeat_find_key,
+    "<Control-space>": apply_script,
+}
+
 def setup_gui():
     root = widgets["root"]
 
@@ -1543,17 +2102,11 @@ def setup_gui():
 
     # ---- bindings
     tree.bind("<<TreeviewSelect>>", handle_tree_selection_changed)
+    tree.bind("<<TreeviewOpen>>", handle_tree_open)
+    tree.bind("<<TreeviewClose>>", handle_tree_close)
 
-    root.bind_all("<Control-o>", lambda e: handle_open_file_command())
-    root.bind_all("<Control-!>", lambda e: handle_reload_file_command())
-    root.bind_all("<Control-s>", lambda e: save_file())
-    root.bind_all("<Control-n>", lambda e: create_from_clipboard())
-    root.bind_all("<Control-i>", lambda e: spawn_new_instance())
-    root.bind_all("<Control-q>", lambda e: exit_application())
-    root.bind_all("<Control-h>", lambda e: display_help())
-    root.bind_all("<Control-f>", lambda e: action_find_key())
-    root.bind_all("<Control-F>", lambda e: action_repeat_find_key())
-    root.bind_all("<Control-space>", apply_script)
+    for sequence, command in ACCELERATORS.items():
+        root.bind_all(sequence, lambda e, command=command: command())
 
     tree.bind("<Control-Up>", on_ctrl_up)
     tree.bind("<Control-Down>", on_ctrl_down)
@@ -1572,80 +2125,19 @@ def setup_gui():
 
 
 def apply_dark_mode():
-    t = widgets["text"]
     root = widgets["root"]
-
-    t.configure(
-        background=THEME_DARK["text_bg"],
-        foreground=THEME_DARK["text_fg"],
-        insertbackground=THEME_DARK["text_insert"],
-        selectbackground=THEME_DARK["text_select_bg"],
-        selectforeground=THEME_DARK["text_select_fg"],
-    )
-
-    style = ttk.Style()
-    style.theme_use("clam")
-
+    widgets["text"].configure(**_TEXT_THEME)
     root.configure(background=THEME_DARK["bg"])
 
-    style.configure(
-        "Treeview",
-        background=THEME_DARK["tree_bg"],
-        foreground=THEME_DARK["tree_fg"],
-        fieldbackground=THEME_DARK["tree_bg"],
-    )
-
-    style.map(
-        "Treeview",
-        background=[("selected", THEME_DARK["tree_select_bg"])],
-        foreground=[("selected", THEME_DARK["tree_select_fg"])],
-    )
-
-    style.configure(
-        "TLabel",
-        background=THEME_DARK["bg"],
-        foreground=THEME_DARK["fg"],
-    )
-
-    style.configure(
-        "TFrame",
-        background=THEME_DARK["bg"],
-    )
-
-    style.configure(
-        "TPanedwindow",
-        background=THEME_DARK["bg"],
-    )
-
-    style.configure(
-        "TButton",
-        background=THEME_DARK["button_bg"],
-        foreground=THEME_DARK["button_fg"],
-        bordercolor=THEME_DARK["bg"],
-        focusthickness=0,
-    )
-
-    style.map(
-        "TButton",
-        background=[("active", THEME_DARK["button_active_bg"])],
-        foreground=[("disabled", THEME_DARK["muted"])],
-    )
-
-    style.configure(
-        "TScrollbar",
-        background=THEME_DARK["bg"],
-        troughcolor=THEME_DARK["bg"],
-        bordercolor=THEME_DARK["bg"],
-        lightcolor=THEME_DARK["bg"],
-        darkcolor=THEME_DARK["bg"],
-        arrowcolor=THEME_DARK["fg"],
-    )
-
-    style.map(
-        "TScrollbar",
-        background=[("active", THEME_DARK["bg"])],
-        arrowcolor=[("active", THEME_DARK["fg"])],
-    )
+    # ttk styles belong to the Tk interpreter; set them once per root
+    if widgets.get("styled_root") is not root:
+        style = ttk.Style()
+        style.theme_use("clam")
+        for name, cfg in _STYLE_CONFIG.items():
+            style.configure(name, **cfg)
+        for name, states in _STYLE_MAP.items():
+            style.map(name, **states)
+        widgets["styled_root"] = root
 
     widgets["status_error"].configure(foreground=THEME_DARK["error"])
 